@@ -1,390 +1,235 @@
+import json
+import sys
+import time
+from pathlib import Path
 import discord
+from discord import Embed
+from discord import app_commands
 from discord.ext import commands
 from ..admin.permissions import is_admin
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_HELP_ALIASES = ('commands', 'h')
+
+# How long a help message stays eligible for in-place edits (seconds)
+_HELP_MESSAGE_TTL = 300
+
+# Help prose lives in data/help.json and is only read when the cog loads
+_HELP_FILE = Path(__file__).resolve().parents[2] / "data" / "help.json"
+
+
+class _LowerStr(commands.Converter):
+    """Normalize a category argument once while discord.py parses it"""
+    
+    async def convert(self, ctx, argument):
+        return sys.intern(argument.lower())
+
+
+class _PrebuiltEmbed(Embed):
+    """Embed that serializes once; cached help embeds are never mutated after build"""
+    
+    # No __slots__ here: Embed.to_dict walks self.__slots__ to find its data
+    
+    def to_dict(self):
+        try:
+            return self._payload
+        except AttributeError:
+            self._payload = super().to_dict()
+            return self._payload
+
+
+def _admin_text(text: str, spec: dict, user_is_admin: bool) -> str:
+    """Append the spec's admin-only line to text for admin users"""
+    if user_is_admin and "admin_suffix" in spec:
+        return "\n".join((text, spec["admin_suffix"]))
+    return text
+
+
+def _build_embed(spec: dict, user_is_admin: bool) -> Embed:
+    """Build one help embed from its JSON spec for an admin or non-admin user"""
+    data = {key: spec[key] for key in ("title", "description", "footer") if key in spec}
+    data["color"] = int(spec["color"], 16)
+    data["fields"] = [
+        {
+            "name": field["name"],
+            "value": _admin_text(field["value"], field, user_is_admin),
+            "inline": False,
+        }
+        for field in spec["fields"]
+        if user_is_admin or not field.get("admin_only")
+    ]
+    return _PrebuiltEmbed.from_dict(data)
+
+
+# Accepted spellings for each category, keyed by canonical help.json key
+_AI_ALIASES = frozenset({'ai', 'bot'})
+_CONTEXT_ALIASES = frozenset({'context'})
+_CRAFTING_ALIASES = frozenset({'crafting', 'craft', 'dune'})
+_ADMIN_ALIASES = frozenset({'admin'})
+_WOW_ALIASES = frozenset({'wow', 'raiderio', 'warcraft'})
+
+# Single lookup table canonicalizing any accepted category name
+_CATEGORY_ALIASES = {
+    alias: canonical
+    for canonical, aliases in (
+        ('ai', _AI_ALIASES),
+        ('context', _CONTEXT_ALIASES),
+        ('crafting', _CRAFTING_ALIASES),
+        ('admin', _ADMIN_ALIASES),
+        ('wow', _WOW_ALIASES),
+    )
+    for alias in aliases
+}
+
+# Static /help autocomplete suggestions; the admin entry is only offered to admins
+_CATEGORY_CHOICES = [
+    app_commands.Choice(name="ai - AI system details", value="ai"),
+    app_commands.Choice(name="context - Context management", value="context"),
+    app_commands.Choice(name="crafting - Dune crafting system", value="crafting"),
+    app_commands.Choice(name="wow - World of Warcraft commands", value="wow"),
+]
+_ADMIN_CATEGORY_CHOICES = _CATEGORY_CHOICES + [
+    app_commands.Choice(name="admin - Admin commands", value="admin"),
+]
+
+# Categories whose embed is identical for admin and non-admin users
+_ADMIN_INVARIANT_CATEGORIES = frozenset({'context', 'crafting'})
+
 
 class HelpCommands(commands.Cog):
     """Help and information commands"""
     
     def __init__(self, bot):
         self.bot = bot
+        help_data = self._load_help_data()
+        self._embed_cache = self._build_all_embeds(help_data)
+        self._dispatch = self._build_dispatch(self._embed_cache)
+        self._unknown_category = self._build_unknown_category(help_data['unknown'])
+        self._last_help_msg = {}  # (channel_id, user_id) -> (message_id, help_key, sent_at)
+    
+    @staticmethod
+    def _load_help_data():
+        """Read the help embed specs from data/help.json"""
+        with open(_HELP_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    @staticmethod
+    def _build_unknown_category(spec):
+        """Prepare the fixed parts of the unknown-category embed per admin class"""
+        title, colour = spec['title'], discord.Colour(int(spec['color'], 16))
+        return {
+            user_is_admin: (title, colour, _admin_text(spec['description'], spec, user_is_admin))
+            for user_is_admin in (False, True)
+        }
+    
+    @staticmethod
+    def _build_all_embeds(help_data):
+        """Build every help embed once for both admin and non-admin users"""
+        # Each category is sent as a single message holding all of its embeds
+        return {
+            (category, user_is_admin): [_build_embed(spec, user_is_admin) for spec in specs]
+            for category, specs in help_data.items()
+            if category != 'unknown'
+            for user_is_admin in (False, True)
+        }
     
-    @commands.command(name='help', aliases=['commands', 'h'])
-    async def help_command(self, ctx, category: str = None):
+    @staticmethod
+    def _build_dispatch(embed_cache):
+        """Map every accepted category spelling to its (user, admin) help replies"""
+        # Each reply is a (help_key, embeds) pair; admin-only categories have no user reply
+        dispatch = {}
+        for alias, canonical in _CATEGORY_ALIASES.items():
+            user_key, admin_key = (canonical, False), (canonical, True)
+            user_help = (user_key, embed_cache[user_key])
+            if canonical in _ADMIN_INVARIANT_CATEGORIES:
+                dispatch[alias] = (user_help, user_help)
+            else:
+                admin_help = (admin_key, embed_cache[admin_key])
+                dispatch[alias] = (None if canonical == 'admin' else user_help, admin_help)
+        return dispatch
+    
+    @commands.hybrid_command(name='help', aliases=_HELP_ALIASES)
+    @commands.cooldown(3, 10, commands.BucketType.user)
+    @commands.max_concurrency(1, per=commands.BucketType.channel, wait=False)
+    @app_commands.describe(category="Help category to show")
+    async def help_command(self, ctx, category: _LowerStr = None):
         """Show all available commands or commands in a specific category"""
+        user_is_admin = is_admin(ctx.author.id)
         if category:
-            await self._show_category_help(ctx, category.lower())
+            await self._show_category_help(ctx, category, user_is_admin)
         else:
-            await self._show_main_help(ctx)
+            await self._show_main_help(ctx, user_is_admin)
+    
+    @help_command.autocomplete('category')
+    async def _category_autocomplete(self, interaction, current):
+        """Suggest help categories for the /help slash command"""
+        choices = _ADMIN_CATEGORY_CHOICES if is_admin(interaction.user.id) else _CATEGORY_CHOICES
+        current = current.lower()
+        return [choice for choice in choices if choice.value.startswith(current)]
     
-    async def _show_main_help(self, ctx):
+    async def cog_command_error(self, ctx, error):
+        """Drop rate-limited and concurrent duplicate help requests locally instead of replying"""
+        if isinstance(error, (commands.CommandOnCooldown, commands.MaxConcurrencyReached)):
+            # Slash commands must still be answered or Discord reports a failure
+            if ctx.interaction is not None:
+                await ctx.send("⏱️ Slow down - try `/help` again in a few seconds.", ephemeral=True)
+            return
+        logger.error(f"Help command error: {error}")
+    
+    async def _show_main_help(self, ctx, user_is_admin):
         """Show the main help menu with all categories"""
-        user_is_admin = is_admin(ctx.author.id)
-        
-        embed = discord.Embed(
-            title="🤖 J.A.R.V.I.S Discord Bot",
-            description="**Primary Interaction**: @mention the bot + your message\n" +
-                       "AI system using OpenAI for all functionality.",
-            color=0x5865f2
-        )
-        
-        # AI Interaction
-        embed.add_field(
-            name="🧠 AI Interaction",
-            value="**@bot + message** - OpenAI with search/admin routing\n" +
-                  "**@bot ai:** - Direct OpenAI chat (no search)\n" +
-                  "**@bot craft:** or **@bot cr:** - Crafting system",
-            inline=False
-        )
-        
-        # Regular Commands
-        embed.add_field(
-            name="📝 Commands",
-            value="`!help <category>` - Show category help\n" +
-                  "`!ping` - Check bot responsiveness\n" +
-                  "`!hello` - Greet the bot\n" +
-                  "`!search <query>` - Google search (top 3 results)",
-            inline=False
-        )
-        
-        # RaiderIO Commands
-        embed.add_field(
-            name="🏆 World of Warcraft",
-            value="`!rio` - Character lookup (uses main character)\n" +
-                  "`!rio_runs` - Recent Mythic+ runs\n" +
-                  "`!rio_details <number>` - Detailed run information\n" +
-                  "`!rio_list` - List all stored runs\n" +
-                  "`!rio_affixes` - Current Mythic+ affixes\n" +
-                  "`!add_char <name> <realm>` - Add WoW character",
-            inline=False
-        )
-        
-        # Context Commands
-        embed.add_field(
-            name="🔄 Context Management", 
-            value="`!remember <text>` - Add permanent context\n" +
-                  "`!memories` - View your permanent context\n" +
-                  "`!forget <number/all>` - Remove context\n" +
-                  "`!add_setting <text>` - Add unfiltered setting\n" +
-                  "`!list_settings` - View unfiltered settings\n" +
-                  "`!remove_setting <number>` - Remove setting",
-            inline=False
-        )
-        
-        # History Commands
-        embed.add_field(
-            name="📚 History & Settings",
-            value="`!clear` - Clear conversation history\n" +
-                  "`!history` - Show recent conversations\n" +
-                  "`!context [on/off]` - Toggle channel context\n" +
-                  "`!clear_settings` - Clear all unfiltered settings\n" +
-                  "`!clear_search_context` - Clear conversation context\n" +
-                  "`!search_context_info` - Show context info",
-            inline=False
-        )
-        
-        # Admin Commands (only show if user is admin)
-        if user_is_admin:
-            embed.add_field(
-                name="🛡️ Admin Features",
-                value="`!admin_panel` - Show pending admin actions\n" +
-                      "`!stats` - Show bot storage statistics\n" +
-                      "`!clear_all_search_contexts` - Clear all contexts\n" +
-                      "**Natural language admin via @mention**",
-                inline=False
-            )
-        
-        embed.add_field(
-            name="📖 Categories",
-            value="`!help ai` - AI system details\n" +
-                  "`!help context` - Context management\n" +
-                  "`!help crafting` - Dune crafting system\n" +
-                  "`!help wow` - World of Warcraft commands" +
-                  ("\n`!help admin` - Admin commands" if user_is_admin else ""),
-            inline=False
-        )
-        
-        embed.set_footer(text="Use !help <category> for detailed information")
-        await ctx.send(embed=embed)
+        help_key = ('main', user_is_admin)
+        await self._send_help(ctx, help_key, self._embed_cache[help_key])
     
-    async def _show_category_help(self, ctx, category):
+    async def _show_category_help(self, ctx, category, user_is_admin):
         """Show help for a specific category"""
-        user_is_admin = is_admin(ctx.author.id)
-        
-        if category in ['ai', 'bot']:
-            embed = discord.Embed(
-                title="🧠 AI System Details",
-                description="AI features and routing",
-                color=0x00ff7f
-            )
-            
-            embed.add_field(
-                name="🎯 Automatic Routing",
-                value="**OpenAI (Default - Search & Admin):**\n" +
-                      "• Query optimization → Google Search → AI analysis\n" +
-                      "• Current events, news, latest information\n" +
-                      "• Research questions, comparisons\n" +
-                      "• Admin actions (kick, ban, etc.)\n" +
-                      "• Questions needing web data\n\n" +
-                      "**Direct AI (`ai:` prefix):**\n" +
-                      "• Pure OpenAI chat without web search\n" +
-                      "• Personal conversations, creative tasks\n" +
-                      "• General knowledge questions",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="🔀 Force Provider Syntax",
-                value="• `@bot ai: message` - Direct OpenAI chat\n" +
-                      "• `@bot craft: item` or `@bot cr: item`",
-                inline=False
-            )
-            
-            if user_is_admin:
-                embed.add_field(
-                    name="🔧 Admin: OpenAI Models",
-                    value="• `@bot use gpt-4o-mini to...` - Fast (default)\n" +
-                          "• `@bot with gpt-4o...` - Balanced\n" +
-                          "• `@bot model: gpt-4-turbo...` - Most capable",
-                    inline=False
-                )
-        
-        elif category == 'context':
-            embed = discord.Embed(
-                title="🔄 Context Management",
-                description="Manage AI memory and settings",
-                color=0xff6b6b
-            )
-            
-            embed.add_field(
-                name="📝 Permanent Context",
-                value="`!remember <text>` - Add permanent context\n" +
-                      "`!memories` - View all permanent context\n" +
-                      "`!forget <number>` - Remove specific item\n" +
-                      "`!forget all` - Clear all permanent context",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="⚙️ Unfiltered Settings",
-                value="`!add_setting <text>` - Add unfiltered setting\n" +
-                      "`!list_settings` - View all settings\n" +
-                      "`!remove_setting <number>` - Remove by number\n" +
-                      "`!clear_settings` - Clear all settings",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="🔍 Conversation Context",
-                value="`!clear` - Clear conversation history\n" +
-                      "`!history` - Show recent conversations\n" +
-                      "`!context [on/off]` - Toggle channel context\n" +
-                      "`!clear_search_context` - Clear current context\n" +
-                      "`!search_context_info` - Show context info",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="💡 Context Types",
-                value="**Permanent**: Always remembered, filtered by relevance\n" +
-                      "**Unfiltered**: Always included, never filtered\n" +
-                      "**Conversation**: Recent chat (expires after 30min)",
-                inline=False
-            )
-        
-        elif category in ['crafting', 'craft', 'dune']:
-            embed = discord.Embed(
-                title="🔨 Dune Awakening Crafting",
-                description="Natural language crafting calculator",
-                color=0x9b59b6
-            )
-            
-            embed.add_field(
-                name="🎯 Usage",
-                value="`@bot craft: <item>` or `@bot cr: <item>`\n\n" +
-                      "**Examples:**\n" +
-                      "• `@bot craft: karpov 38 plastanium`\n" +
-                      "• `@bot craft: sandbike mk3`\n" +
-                      "• `@bot craft: 5 healing kits`\n" +
-                      "• `@bot craft: list` - Show categories",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="📊 Database Stats",
-                value="• **232 Total Recipes**\n" +
-                      "• ~50 Weapons (7 material tiers)\n" +
-                      "• ~150 Vehicles (sandbikes, buggies, ornithopters)\n" +
-                      "• Tools, components, materials",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="⚔️ Material Tiers",
-                value="Salvage → Copper → Iron → Steel →\n" +
-                      "Aluminum → Duraluminum → Plastanium",
-                inline=False
-            )
-        
-        elif category == 'admin' and user_is_admin:
-            embed = discord.Embed(
-                title="🛡️ Admin Commands",
-                description="Natural language admin with confirmations",
-                color=0xe74c3c
-            )
-            
-            embed.add_field(
-                name="📊 Admin Commands",
-                value="`!admin_panel` - Show pending actions\n" +
-                      "`!stats` - Bot storage statistics\n" +
-                      "`!clear_all_search_contexts` - Clear all user contexts",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="👥 Natural Language Admin",
-                value="**User Management:**\n" +
-                      "• `@bot kick @user`\n" +
-                      "• `@bot ban @user for reason`\n" +
-                      "• `@bot timeout @user for 1 hour`\n\n" +
-                      "**Messages:**\n" +
-                      "• `@bot delete 10 messages`\n" +
-                      "• `@bot delete messages from @user`\n\n" +
-                      "**Roles:**\n" +
-                      "• `@bot add role RoleName to @user`\n" +
-                      "• `@bot remove role RoleName from @user`\n" +
-                      "• `@bot rename role OldName to NewName`",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="⚠️ Safety",
-                value="All actions require confirmation:\n" +
-                      "• React ✅ to confirm\n" +
-                      "• React ❌ to cancel\n" +
-                      "• Auto-expires after 5 minutes",
-                inline=False
-            )
-        
-        elif category in ['wow', 'raiderio', 'warcraft']:
-            embed = discord.Embed(
-                title="🏆 World of Warcraft Commands",
-                description="RaiderIO integration for Mythic+ and character data",
-                color=0xf4c430
-            )
-            
-            embed.add_field(
-                name="🎮 Character Management",
-                value="`!add_char <name> <realm> [region]` - Add character\n" +
-                      "`!set_main [number]` - Set main character\n" +
-                      "`!list_chars` - List your characters\n" +
-                      "`!remove_char <number>` - Remove character\n" +
-                      "`!clear_chars` - Clear all characters\n\n" +
-                      "**Examples:**\n" +
-                      "• `!add_char Thrall Mal'Ganis` (defaults to US)\n" +
-                      "• `!add_char Gandalf Stormrage eu`",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="📊 Character Lookup",
-                value="`!rio` - Profile for your main character\n" +
-                      "`!rio 2` - Profile for your character #2\n" +
-                      "`!rio <name> <realm> [region]` - Manual lookup\n\n" +
-                      "**Shows:** Mythic+ score, recent high run, raid progress, gear",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="🏃 Mythic+ Runs",
-                value="`!rio_runs` - Recent runs (main character)\n" +
-                      "`!rio_runs 2` - Recent runs (character #2)\n" +
-                      "`!rio_runs <name> <realm>` - Manual lookup\n" +
-                      "`!rio_list [limit]` - List all stored runs (default: 20)\n\n" +
-                      "**Shows:** Numbered list of recent runs with completion times and dates",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="🔍 Detailed Run Analysis",
-                value="`!rio_details <number>` - Details for recent run\n" +
-                      "`!rio_details 2 3` - Run #3 from character #2\n" +
-                      "`!rio_details <run_id>` - Manual run ID lookup\n\n" +
-                      "**Shows:** Team composition, affixes, precise timing, completion status",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="⚡ Weekly Affixes",
-                value="`!rio_affixes` - Current affixes (US)\n" +
-                      "`!rio_affixes 2` - Affixes for character #2's region\n" +
-                      "`!rio_affixes eu` - Affixes for specific region\n\n" +
-                      "**Shows:** Current week's Mythic+ modifiers with descriptions",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="📊 Season Cutoffs",
-                value="`!rio_cutoff` - Rating thresholds (US, current season)\n" +
-                      "`!rio_cutoff 2` - Cutoffs for character #2's region\n" +
-                      "`!rio_cutoff eu` - EU region cutoffs\n" +
-                      "`!rio_cutoff us season-tww-3` - Specific season\n\n" +
-                      "**Shows:** Rating thresholds for top percentiles (99th, 95th, 90th, etc.)",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="⚙️ Season Management",
-                value="`!rio_season` - View/set season for run details\n" +
-                      "`!rio_season season-tww-3` - Set specific season\n" +
-                      "`!rio_season current` - Use current season\n" +
-                      "`!rio_season reset` - Reset to current\n\n" +
-                      "**Affects:** !rio_details command (cutoffs always use current unless specified)",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="🌍 Supported Regions",
-                value="• **US** (default)\n• **EU** (Europe)\n• **KR** (Korea)\n• **TW** (Taiwan)\n• **CN** (China)",
-                inline=False
-            )
-            
-            if user_is_admin:
-                embed.add_field(
-                    name="🛠️ Admin WoW Commands",
-                    value="`!debug_chars` - Debug character data structure\n" +
-                          "`!reload_chars` - Reload character data from file\n" +
-                          "`!char_errors` - Show character loading errors\n" +
-                          "`!force_save_chars` - Force save character data\n" +
-                          "`!rio_prefetch` - Pre-fetch runs for all characters\n" +
-                          "`!rio_reset_runs` - Reset runs database (new season)",
-                    inline=False
-                )
-            
-            embed.add_field(
-                name="💡 Workflow Tips",
-                value="1. Add your characters with `!add_char`\n" +
-                      "2. Set your main with `!set_main`\n" +
-                      "3. Use `!rio_runs` to see numbered recent runs\n" +
-                      "4. Use `!rio_details <number>` for detailed analysis\n" +
-                      "5. Use `!rio_list` to see all stored runs from all characters\n" +
-                      "6. All commands work without stored characters too!",
-                inline=False
-            )
-        
-        else:
-            embed = discord.Embed(
-                title="❌ Unknown Category",
-                description=f"Category '{category}' not found.\n\n" +
-                           "**Available categories:**\n" +
-                           "• `ai` - AI system details\n" +
-                           "• `context` - Context management\n" +
-                           "• `crafting` - Dune crafting system\n" +
-                           "• `wow` - World of Warcraft commands" +
-                           ("\n• `admin` - Admin commands" if user_is_admin else ""),
-                color=0x95a5a6
-            )
-        
-        await ctx.send(embed=embed)
+        entry = self._dispatch.get(category)
+        if entry is not None:
+            user_help, admin_help = entry
+            reply = admin_help if user_is_admin else user_help
+            if reply is not None:
+                await self._send_help(ctx, *reply)
+                return
+        
+        # Only the description varies; building a fresh field-less Embed is cheaper than copying one
+        title, colour, template = self._unknown_category[user_is_admin]
+        embeds = [Embed(title=title, description=template.replace("{CAT}", category), colour=colour)]
+        await self._send_help(ctx, None, embeds)
+    
+    async def _send_help(self, ctx, help_key, embeds):
+        """Send help embeds, editing the caller's recent help message instead when possible"""
+        if ctx.interaction is not None:
+            # Slash invocations must always be answered; ephemeral replies can't be edited later
+            await ctx.send(embeds=embeds, ephemeral=True)
+            return
+        
+        slot = (ctx.channel.id, ctx.author.id)
+        now = time.monotonic()
+        last = self._last_help_msg.get(slot)
+        
+        if last and now - last[2] < _HELP_MESSAGE_TTL:
+            message_id, last_key, sent_at = last
+            if help_key is not None and help_key == last_key:
+                return  # Same help is already on screen
+            try:
+                await ctx.channel.get_partial_message(message_id).edit(embeds=embeds)
+                self._last_help_msg[slot] = (message_id, help_key, sent_at)
+                return
+            except discord.HTTPException:
+                pass  # Message was deleted or can't be edited, send a new one
+        
+        # Forget expired help messages before tracking the new one
+        self._last_help_msg = {
+            key: entry for key, entry in self._last_help_msg.items()
+            if now - entry[2] < _HELP_MESSAGE_TTL
+        }
+        message = await ctx.send(embeds=embeds)
+        self._last_help_msg[slot] = (message.id, help_key, now)
 
 async def setup(bot):
+    # Skip rebuilding the embed cache if the cog is already registered
+    if bot.get_cog('HelpCommands'):
+        return
     await bot.add_cog(HelpCommands(bot))
\ No newline at end of file
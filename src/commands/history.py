@@ -1,41 +1,81 @@
+import re
+import time
 import discord
 from discord.ext import commands
 from ..data.persistence import data_manager
+from ..utils.command_guard import CommandGuard
+
+# Discord user mentions: <@id> or the legacy nickname form <@!id>
+_MENTION_RE = re.compile(r'<@!?(\d+)>')
+
+# Command names, shared by the decorators and the in-progress lock keys
+_CMD_CLEAR = 'clear'
+_CMD_HISTORY = 'history'
+_CMD_CONTEXT = 'context'
+_CMD_ADD_SETTING = 'add_setting'
+_CMD_LIST_SETTINGS = 'list_settings'
+_CMD_REMOVE_SETTING = 'remove_setting'
+_CMD_CLEAR_SETTINGS = 'clear_settings'
+
+# Accepted !context arguments
+_ON = frozenset({'on', 'true', 'enable', 'yes'})
+_OFF = frozenset({'off', 'false', 'disable', 'no'})
+
+# No-op replies delete themselves after this many seconds, and each user gets at most one per window
+_NOOP_REPLY_TTL = 10
+
+# Discord allows at most 25 fields per embed
+_EMBED_FIELD_LIMIT = 25
+
+def _trunc(text: str, limit: int) -> str:
+    """Shorten text to limit characters for display"""
+    return f"{text[:limit]}..." if len(text) > limit else text
 
 class HistoryCommands(commands.Cog):
     """Commands for managing conversation history"""
     
     def __init__(self, bot):
         self.bot = bot
-        self._executing_commands = set()  # Track commands being executed to prevent duplicates
+        self._guard = CommandGuard()  # one run at a time per (command, author_id[, arg]) key
+        self._noop_replies = {}  # author_id -> time of the last no-op reply
     
-    @commands.command(name='clear')
+    async def _reply_noop(self, ctx, text):
+        """Briefly answer a command that changed nothing, skipping repeats within the TTL"""
+        now = time.monotonic()
+        if now - self._noop_replies.get(ctx.author.id, float('-inf')) < _NOOP_REPLY_TTL:
+            return
+        self._noop_replies = {
+            author_id: sent_at for author_id, sent_at in self._noop_replies.items()
+            if now - sent_at < _NOOP_REPLY_TTL
+        }
+        self._noop_replies[ctx.author.id] = now
+        await ctx.reply(text, mention_author=False, delete_after=_NOOP_REPLY_TTL)
+    
+    async def cog_unload(self):
+        """Write out any settings still waiting on the debounced save"""
+        await data_manager.flush_dirty()
+    
+    @commands.command(name=_CMD_CLEAR)
     async def clear_history(self, ctx):
         """Clear your conversation history with the AI"""
-        command_key = f"clear_{ctx.author.id}"
-        if command_key in self._executing_commands:
-            return
-        
-        self._executing_commands.add(command_key)
-        try:
+        async with self._guard.exclusive((_CMD_CLEAR, ctx.author.id)) as acquired:
+            if not acquired:
+                return
+            
             user_key = data_manager.get_user_key(ctx.author)
             if data_manager.clear_user_history(user_key):
-                await data_manager.save_conversation_history()
+                data_manager.mark_dirty("conversation_history")
                 await ctx.send('✅ Your conversation history has been cleared!')
             else:
-                await ctx.send('No conversation history to clear.')
-        finally:
-            self._executing_commands.discard(command_key)
+                await self._reply_noop(ctx, 'No conversation history to clear.')
     
-    @commands.command(name='history')
+    @commands.command(name=_CMD_HISTORY)
     async def show_history(self, ctx):
         """Show your recent conversation history"""
-        command_key = f"history_{ctx.author.id}"
-        if command_key in self._executing_commands:
-            return
-        
-        self._executing_commands.add(command_key)
-        try:
+        async with self._guard.exclusive((_CMD_HISTORY, ctx.author.id)) as acquired:
+            if not acquired:
+                return
+            
             user_key = data_manager.get_user_key(ctx.author)
             history = data_manager.get_user_history(user_key)
             
@@ -44,166 +84,145 @@ class HistoryCommands(commands.Cog):
                 return
             
             # Show last 6 messages
-            recent_history = history[-6:]
-            response = "**Recent conversation history:**\n"
-            
-            for msg in recent_history:
-                role = "You" if msg["role"] == "user" else "AI"
-                content = msg["content"][:100] + "..." if len(msg["content"]) > 100 else msg["content"]
-                response += f"**{role}:** {content}\n"
-            
-            await ctx.send(response)
-        finally:
-            self._executing_commands.discard(command_key)
+            embed = discord.Embed(title="📜 Recent Conversation History", color=0x0099ff)
+            for msg in history[-6:]:
+                embed.add_field(
+                    name="You" if msg["role"] == "user" else "AI",
+                    value=_trunc(msg["content"], 100) or "*(empty)*",
+                    inline=False
+                )
+            
+            await ctx.send(embed=embed)
     
-    @commands.command(name='context')
+    @commands.command(name=_CMD_CONTEXT)
     async def toggle_context(self, ctx, setting=None):
         """Toggle or check channel context usage for AI responses"""
-        command_key = f"context_{ctx.author.id}_{setting}"
-        if command_key in self._executing_commands:
-            return
-        
-        self._executing_commands.add(command_key)
-        try:
+        async with self._guard.exclusive((_CMD_CONTEXT, ctx.author.id, setting)) as acquired:
+            if not acquired:
+                return
+            
             user_key = data_manager.get_user_key(ctx.author)
-            user_settings = data_manager.get_user_settings(user_key)
             
             if setting is None:
                 # Show current setting
-                current = user_settings.get("use_channel_context", True)
+                current = data_manager.get_user_settings(user_key).get("use_channel_context", True)
                 status = "enabled" if current else "disabled"
                 await ctx.send(f"Channel context is currently **{status}** for you.\nUse `!context on` or `!context off` to change.")
                 return
             
-            if setting.lower() in ['on', 'true', 'enable', 'yes']:
+            setting = setting.lower()
+            if setting in _ON:
                 data_manager.update_user_setting(user_key, "use_channel_context", True)
-                await data_manager.save_user_settings()
+                data_manager.mark_dirty("user_settings")
                 await ctx.send("✅ Channel context **enabled**! The AI will now read recent channel messages for better context.")
-            elif setting.lower() in ['off', 'false', 'disable', 'no']:
+            elif setting in _OFF:
                 data_manager.update_user_setting(user_key, "use_channel_context", False)
-                await data_manager.save_user_settings()
+                data_manager.mark_dirty("user_settings")
                 await ctx.send("❌ Channel context **disabled**! The AI will only use your personal conversation history.")
             else:
                 await ctx.send("Please use `!context on` or `!context off` to toggle channel context.")
-        finally:
-            self._executing_commands.discard(command_key)
     
-    @commands.command(name='add_setting')
+    @commands.command(name=_CMD_ADD_SETTING)
     async def add_unfiltered_setting(self, ctx, *, setting_text):
         """Add an unfiltered permanent setting that applies to ALL queries"""
-        command_key = f"add_setting_{ctx.author.id}"
-        if command_key in self._executing_commands:
-            return
-        
-        self._executing_commands.add(command_key)
-        try:
+        async with self._guard.exclusive((_CMD_ADD_SETTING, ctx.author.id)) as acquired:
+            if not acquired:
+                return
+            
             user_key = data_manager.get_user_key(ctx.author)
             
-            # Resolve Discord mentions to usernames before saving
-            import re
-            resolved_text = setting_text
-            mention_pattern = r'<@!?(\d+)>'
-            mentions = re.findall(mention_pattern, setting_text)
-            
-            for user_id in mentions:
-                try:
-                    user = ctx.guild.get_member(int(user_id)) or self.bot.get_user(int(user_id))
-                    if user:
-                        mention_formats = [f'<@{user_id}>', f'<@!{user_id}>']
-                        for mention_format in mention_formats:
-                            resolved_text = resolved_text.replace(mention_format, user.display_name)
-                except Exception as e:
-                    pass
+            # Resolve Discord mentions to usernames before saving, looking each user up once
+            names = {}
+            
+            def resolve_mention(match):
+                user_id = match.group(1)
+                if user_id not in names:
+                    user = (ctx.guild and ctx.guild.get_member(int(user_id))) or self.bot.get_user(int(user_id))
+                    names[user_id] = user.display_name if user else None
+                return names[user_id] or match.group(0)
+            
+            resolved_text = _MENTION_RE.sub(resolve_mention, setting_text)
             
             data_manager.add_unfiltered_permanent_context(resolved_text)
-            await data_manager.save_unfiltered_permanent_context()
+            data_manager.mark_dirty("unfiltered_permanent_context")
             await ctx.send(f'✅ **Global setting added!** This will apply to ALL users and queries:\n> {resolved_text}')
-        finally:
-            self._executing_commands.discard(command_key)
     
-    @commands.command(name='list_settings')
+    @commands.command(name=_CMD_LIST_SETTINGS)
     async def list_unfiltered_settings(self, ctx):
         """List all your unfiltered permanent settings"""
-        command_key = f"list_settings_{ctx.author.id}"
-        if command_key in self._executing_commands:
-            return
-        
-        self._executing_commands.add(command_key)
-        try:
+        async with self._guard.exclusive((_CMD_LIST_SETTINGS, ctx.author.id)) as acquired:
+            if not acquired:
+                return
+            
             settings = data_manager.get_unfiltered_permanent_context()
             
             if not settings:
                 await ctx.send('No global settings found.')
                 return
             
-            response = "**Global settings** (applied to ALL users and queries):\n"
-            for i, setting in enumerate(settings, 1):
-                # Truncate long settings for display
-                display_setting = setting[:150] + "..." if len(setting) > 150 else setting
-                response += f"{i}. {display_setting}\n"
-            
-            await ctx.send(response)
-        finally:
-            self._executing_commands.discard(command_key)
+            # One embed per batch of settings, since an embed holds at most 25 fields
+            for start in range(0, len(settings), _EMBED_FIELD_LIMIT):
+                if start == 0:
+                    embed = discord.Embed(
+                        title="⚙️ Global Settings",
+                        description="Applied to ALL users and queries",
+                        color=0x0099ff
+                    )
+                else:
+                    embed = discord.Embed(color=0x0099ff)
+                for i, setting in enumerate(settings[start:start + _EMBED_FIELD_LIMIT], start + 1):
+                    embed.add_field(name=f"{i}.", value=_trunc(setting, 150) or "*(empty)*", inline=False)
+                await ctx.send(embed=embed)
     
-    @commands.command(name='remove_setting')
+    @commands.command(name=_CMD_REMOVE_SETTING)
     async def remove_unfiltered_setting(self, ctx, index: int):
         """Remove an unfiltered permanent setting by its number (use !list_settings to see numbers)"""
-        command_key = f"remove_setting_{ctx.author.id}_{index}"
-        if command_key in self._executing_commands:
-            return
-        
-        self._executing_commands.add(command_key)
-        try:
-            # Validate index
-            if index < 1:
-                await ctx.send(f'❌ Setting number must be 1 or higher. Use `!list_settings` to see valid numbers.')
+        async with self._guard.exclusive((_CMD_REMOVE_SETTING, ctx.author.id, index)) as acquired:
+            if not acquired:
                 return
             
-            # Get current settings to show count
-            current_settings = data_manager.get_unfiltered_permanent_context()
-            if not current_settings:
-                await ctx.send('❌ No global settings found to remove.')
-                return
-            
-            if index > len(current_settings):
-                await ctx.send(f'❌ Invalid setting number: {index}. There are only {len(current_settings)} settings. Use `!list_settings` to see valid numbers.')
-                return
-            
-            # Convert to 0-based index and remove
-            removed_setting = data_manager.remove_unfiltered_permanent_context(index - 1)
-            
-            if removed_setting:
-                await data_manager.save_unfiltered_permanent_context()
-                # Truncate long settings for display
-                display_setting = removed_setting[:100] + "..." if len(removed_setting) > 100 else removed_setting
-                await ctx.send(f'✅ **Global setting removed:**\n> {display_setting}')
-            else:
-                await ctx.send(f'❌ Failed to remove setting {index}. Use `!list_settings` to see valid numbers.')
+            try:
+                # Validate index
+                if index < 1:
+                    await ctx.send(f'❌ Setting number must be 1 or higher. Use `!list_settings` to see valid numbers.')
+                    return
+                
+                # Get current settings to show count
+                current_settings = data_manager.get_unfiltered_permanent_context()
+                if not current_settings:
+                    await self._reply_noop(ctx, '❌ No global settings found to remove.')
+                    return
+                
+                if index > len(current_settings):
+                    await ctx.send(f'❌ Invalid setting number: {index}. There are only {len(current_settings)} settings. Use `!list_settings` to see valid numbers.')
+                    return
                 
-        except Exception as e:
-            await ctx.send(f'❌ Error removing setting: {str(e)}')
-        finally:
-            self._executing_commands.discard(command_key)
+                # Convert to 0-based index and remove
+                removed_setting = data_manager.remove_unfiltered_permanent_context(index - 1)
+                
+                if removed_setting:
+                    data_manager.mark_dirty("unfiltered_permanent_context")
+                    await ctx.send(f'✅ **Global setting removed:**\n> {_trunc(removed_setting, 100)}')
+                else:
+                    await ctx.send(f'❌ Failed to remove setting {index}. Use `!list_settings` to see valid numbers.')
+                
+            except Exception as e:
+                await ctx.send(f'❌ Error removing setting: {str(e)}')
     
-    @commands.command(name='clear_settings')
+    @commands.command(name=_CMD_CLEAR_SETTINGS)
     async def clear_unfiltered_settings(self, ctx):
         """Clear ALL your unfiltered permanent settings"""
-        command_key = f"clear_settings_{ctx.author.id}"
-        if command_key in self._executing_commands:
-            return
-        
-        self._executing_commands.add(command_key)
-        try:
+        async with self._guard.exclusive((_CMD_CLEAR_SETTINGS, ctx.author.id)) as acquired:
+            if not acquired:
+                return
+            
             count = data_manager.clear_unfiltered_permanent_context()
             
             if count > 0:
-                await data_manager.save_unfiltered_permanent_context()
+                data_manager.mark_dirty("unfiltered_permanent_context")
                 await ctx.send(f'✅ **Cleared {count} global setting(s)!**')
             else:
-                await ctx.send('No global settings to clear.')
-        finally:
-            self._executing_commands.discard(command_key)
+                await self._reply_noop(ctx, 'No global settings to clear.')
 
 async def setup(bot):
     await bot.add_cog(HistoryCommands(bot))
\ No newline at end of file
@@ -4,14 +4,16 @@ World of Warcraft Mythic+ and character lookup functionality
 """
 
 import discord
+from discord import app_commands
 from discord.ext import commands
 import asyncio
-from typing import Dict, Optional, Any
-from ..wow.command_handlers import CommandHandlers
-from ..wow.character_manager import character_manager
+from typing import Dict, Optional, Any, Tuple
+from ..wow.command_handlers import CommandHandlers, VALID_REGIONS_TEXT
+from ..wow.raiderio_client import raiderio_client
 from ..wow.run_manager import run_manager
 from ..wow.season_manager import season_manager
 from ..config import config
+from ..utils.command_guard import CommandGuard
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -24,9 +26,14 @@ class RaiderIOCommands(commands.Cog):
     def __init__(self, bot):
         logger.info("Initializing RaiderIOCommands cog...")
         self.bot = bot
-        self._executing_commands = set()
+        self._guard = CommandGuard()  # one run at a time per (command, author_id) key
+        self._help_embed = self._build_help_embed()
         logger.info("RaiderIOCommands cog initialized successfully")
     
+    async def cog_unload(self):
+        """Close the RaiderIO HTTP session and its pooled connections"""
+        await raiderio_client.close()
+    
     @commands.command(name='rio')
     async def raiderio_lookup(self, ctx, *, args: str = None):
         """
@@ -40,48 +47,17 @@ class RaiderIOCommands(commands.Cog):
         !rio Gandalf Stormrage eu   # specify EU region
         !rio help
         """
-        # Prevent duplicate execution
-        command_key = f"rio_{ctx.author.id}"
-        if command_key in self._executing_commands:
-            return
-        
-        self._executing_commands.add(command_key)
+        async def prepare():
+            parsed = await self._parse_character(ctx, args)
+            if parsed is None:
+                return None
+            character, realm, region = parsed
+            return (
+                f"🔍 Looking up **{character}** on **{realm}** ({region.upper()})...",
+                lambda: CommandHandlers.handle_character_lookup(character, realm, region)
+            )
         
-        try:
-            # Handle stored characters
-            character_data = await CommandHandlers.parse_character_args(ctx, args)
-            if character_data is None:
-                return  # Error message already sent
-            
-            if character_data.get('show_help'):
-                await self._show_help(ctx)
-                return
-            
-            character = character_data['name']
-            realm = character_data['realm']
-            region = character_data['region']
-            
-            # Validate region
-            if not CommandHandlers.validate_region(region):
-                await ctx.send(f"❌ **Invalid region**: `{region}`. Valid regions: us, eu, kr, tw, cn")
-                return
-            
-            # Send loading message
-            loading_msg = await ctx.send(f"🔍 Looking up **{character}** on **{realm}** ({region.upper()})...")
-            
-            # Handle character lookup
-            success, result = await CommandHandlers.handle_character_lookup(region, realm, character)
-            
-            if success:
-                await loading_msg.edit(content=None, embed=result)
-            else:
-                await loading_msg.edit(content=result)
-                
-        except Exception as e:
-            logger.error(f"RaiderIO command error: {e}")
-            await ctx.send(f"❌ **Error**: Failed to lookup character data")
-        finally:
-            self._executing_commands.discard(command_key)
+        await self._run_lookup(ctx, "rio", "Failed to lookup character data", prepare)
     
     @commands.command(name='rio_runs')
     async def raiderio_runs(self, ctx, *, args: str = None):
@@ -94,41 +70,17 @@ class RaiderIOCommands(commands.Cog):
         !rio_runs <character> <realm> [region]
         Default region is US if not specified
         """
-        command_key = f"rio_runs_{ctx.author.id}"
-        if command_key in self._executing_commands:
-            return
-        
-        self._executing_commands.add(command_key)
+        async def prepare():
+            parsed = await self._parse_character(ctx, args)
+            if parsed is None:
+                return None
+            character, realm, region = parsed
+            return (
+                f"🔍 Fetching Mythic+ runs for **{character}**...",
+                lambda: CommandHandlers.handle_runs_lookup(character, realm, region, ctx)
+            )
         
-        try:
-            # Handle stored characters
-            character_data = await CommandHandlers.parse_character_args(ctx, args)
-            if character_data is None:
-                return  # Error message already sent
-            
-            if character_data.get('show_help'):
-                await self._show_help(ctx)
-                return
-            
-            character = character_data['name']
-            realm = character_data['realm']
-            region = character_data['region']
-            
-            loading_msg = await ctx.send(f"🔍 Fetching Mythic+ runs for **{character}**...")
-            
-            # Handle runs lookup
-            success, result = await CommandHandlers.handle_runs_lookup(character, realm, region, ctx)
-            
-            if success:
-                await loading_msg.edit(content=None, embed=result)
-            else:
-                await loading_msg.edit(content=result)
-                
-        except Exception as e:
-            logger.error(f"RaiderIO runs command error: {e}")
-            await ctx.send(f"❌ **Error**: Failed to fetch runs data")
-        finally:
-            self._executing_commands.discard(command_key)
+        await self._run_lookup(ctx, "rio_runs", "Failed to fetch runs data", prepare)
     
     @commands.command(name='rio_affixes')
     async def raiderio_affixes(self, ctx, *, args: str = None):
@@ -140,33 +92,16 @@ class RaiderIOCommands(commands.Cog):
         !rio_affixes eu              # Specify region
         !rio_affixes 2               # Uses your character #2's region
         """
-        command_key = f"rio_affixes_{ctx.author.id}"
-        if command_key in self._executing_commands:
-            return
-        
-        self._executing_commands.add(command_key)
-        
-        try:
-            # Determine region
+        async def prepare():
             region = await self._parse_region_from_args(ctx, args)
             if region is None:
-                return  # Error already sent
-            
-            loading_msg = await ctx.send(f"🔍 Fetching current Mythic+ affixes for {region.upper()}...")
-            
-            # Handle affixes lookup
-            success, result = await CommandHandlers.handle_affixes_lookup(region)
-            
-            if success:
-                await loading_msg.edit(content=None, embed=result)
-            else:
-                await loading_msg.edit(content=result)
-                
-        except Exception as e:
-            logger.error(f"RaiderIO affixes command error: {e}")
-            await ctx.send(f"❌ **Error**: Failed to fetch affixes data")
-        finally:
-            self._executing_commands.discard(command_key)
+                return None
+            return (
+                f"🔍 Fetching current Mythic+ affixes for {region.upper()}...",
+                lambda: CommandHandlers.handle_affixes_lookup(region)
+            )
+        
+        await self._run_lookup(ctx, "rio_affixes", "Failed to fetch affixes data", prepare)
     
     @commands.command(name='rio_details')
     async def raiderio_details(self, ctx, *, args: str = None):
@@ -179,67 +114,63 @@ class RaiderIOCommands(commands.Cog):
         !rio_details <run_id> [season]   # Manual run ID lookup
         !rio_details 12345678
         """
-        command_key = f"rio_details_{ctx.author.id}"
-        if command_key in self._executing_commands:
-            return
-        
-        self._executing_commands.add(command_key)
-        
-        try:
-            if not args:
-                await ctx.send("❌ **Usage**: `!rio_details <run_number>` or `!rio_details <run_id>`\nExample: `!rio_details 1` (first recent run from main character)")
+        async with self._guard.exclusive(("rio_details", ctx.author.id)) as acquired:
+            if not acquired:
                 return
             
-            parts = args.strip().split()
-            
-            # Check if it's a simple number (global sequential run ID)
-            if len(parts) == 1 and parts[0].isdigit():
-                sequential_id = int(parts[0])
-                loading_msg = await ctx.send(f"🔍 Fetching details for run #{sequential_id}...")
-                
-                success, result = await CommandHandlers.handle_run_details_lookup(sequential_id)
+            try:
+                if not args:
+                    await ctx.send("❌ **Usage**: `!rio_details <run_number>` or `!rio_details <run_id>`\nExample: `!rio_details 1` (first recent run from main character)")
+                    return
                 
-                if success:
-                    await loading_msg.edit(content=None, embed=result)
-                else:
-                    await loading_msg.edit(content=result)
+                parts = args.strip().split()
                 
-            # Manual run ID lookup
-            else:
-                try:
-                    run_id = int(parts[0])
-                    season = parts[1] if len(parts) > 1 else None
-                    
-                    loading_msg = await ctx.send(f"🔍 Fetching run details for ID: {run_id}...")
+                # Check if it's a simple number (global sequential run ID)
+                if len(parts) == 1 and parts[0].isdecimal():
+                    sequential_id = int(parts[0])
+                    loading_msg = await ctx.send(f"🔍 Fetching details for run #{sequential_id}...")
                     
-                    success, result = await CommandHandlers.handle_manual_run_details_lookup(run_id, season)
+                    success, result = await CommandHandlers.handle_run_details_lookup(sequential_id)
                     
                     if success:
                         await loading_msg.edit(content=None, embed=result)
                     else:
                         await loading_msg.edit(content=result)
+                    
+                # Manual run ID lookup
+                else:
+                    try:
+                        run_id = int(parts[0])
+                        season = parts[1] if len(parts) > 1 else None
                         
-                except ValueError:
-                    await ctx.send("❌ **Usage**: `!rio_details <run_number>` or `!rio_details <run_id>`")
-                    return
+                        loading_msg = await ctx.send(f"🔍 Fetching run details for ID: {run_id}...")
+                        
+                        success, result = await CommandHandlers.handle_manual_run_details_lookup(run_id, season)
+                        
+                        if success:
+                            await loading_msg.edit(content=None, embed=result)
+                        else:
+                            await loading_msg.edit(content=result)
+                            
+                    except ValueError:
+                        await ctx.send("❌ **Usage**: `!rio_details <run_number>` or `!rio_details <run_id>`")
+                        return
+                    
+            except Exception as e:
+                logger.exception("RaiderIO run details command error: %s", e)
+                import traceback
+                error_details = traceback.format_exc()
                 
-        except Exception as e:
-            logger.error(f"RaiderIO run details command error: {e}", exc_info=True)
-            import traceback
-            error_details = traceback.format_exc()
-            
-            # Send detailed error to Discord for debugging
-            error_msg = f"❌ **Error**: Failed to fetch run details\n"
-            error_msg += f"**Error Type**: {type(e).__name__}\n"
-            error_msg += f"**Error Message**: {str(e)}\n"
-            
-            # If it's a specific error we can handle better
-            if "loading_msg" not in locals():
-                await ctx.send(error_msg)
-            else:
-                await loading_msg.edit(content=error_msg)
-        finally:
-            self._executing_commands.discard(command_key)
+                # Send detailed error to Discord for debugging
+                error_msg = f"❌ **Error**: Failed to fetch run details\n"
+                error_msg += f"**Error Type**: {type(e).__name__}\n"
+                error_msg += f"**Error Message**: {str(e)}\n"
+                
+                # If it's a specific error we can handle better
+                if "loading_msg" not in locals():
+                    await ctx.send(error_msg)
+                else:
+                    await loading_msg.edit(content=error_msg)
     
     @commands.command(name='rio_list')
     async def list_all_runs(self, ctx, limit: int = 20):
@@ -250,81 +181,79 @@ class RaiderIOCommands(commands.Cog):
         !rio_list           # Show last 20 runs
         !rio_list 50        # Show last 50 runs
         """
-        command_key = f"rio_list_{ctx.author.id}"
-        if command_key in self._executing_commands:
-            return
-        
-        self._executing_commands.add(command_key)
-        
-        try:
-            # Validate limit
-            if limit < 1 or limit > 100:
-                await ctx.send("❌ Limit must be between 1 and 100")
+        async with self._guard.exclusive(("rio_list", ctx.author.id)) as acquired:
+            if not acquired:
                 return
             
-            # Get recent runs from global database
-            recent_runs = await run_manager.get_recent_runs(limit)
-            
-            if not recent_runs:
-                await ctx.send("❌ No runs stored in database yet. Use `!rio_runs` to load runs first.")
-                return
-            
-            # Create paginated embed
-            embed = discord.Embed(
-                title="🗂️ All Stored Runs",
-                description=f"Showing last {len(recent_runs)} run(s)",
-                color=0x3498db
-            )
-            
-            runs_text = ""
-            for run_entry in recent_runs:
-                seq_id = run_entry["sequential_id"]
-                run_data = run_entry["data"]
-                character_info = run_entry.get("character", {})
+            try:
+                # Validate limit
+                if limit < 1 or limit > 100:
+                    await ctx.send("❌ Limit must be between 1 and 100")
+                    return
                 
-                # Extract run information
-                dungeon = run_data.get("dungeon", "Unknown")
-                level = run_data.get("mythic_level", 0)
-                # Check if run was completed (even if depleted) vs abandoned
-                # Runs with score > 0 or clear_time_ms > 0 were completed
-                if run_data.get("score", 0) > 0 or run_data.get("clear_time_ms", 0) > 0:
-                    completed = "✅" if run_data.get("num_chests", 0) >= 1 else "⏱️"  # Timed vs Depleted
-                else:
-                    completed = "❌"  # Abandoned/Failed
+                # Get recent runs from global database
+                recent_runs = await run_manager.get_recent_runs(limit)
                 
-                # Character information
-                char_name = character_info.get("name", "Unknown")
-                char_realm = character_info.get("realm", "Unknown")
-                char_region = character_info.get("region", "us").upper()
+                if not recent_runs:
+                    await ctx.send("❌ No runs stored in database yet. Use `!rio_runs` to load runs first.")
+                    return
                 
-                # Date information
-                completed_at = run_data.get("completed_at", "")
-                if completed_at:
-                    date_str = completed_at.split('T')[0] if 'T' in completed_at else completed_at
-                else:
-                    date_str = "Unknown"
+                # Create paginated embed
+                embed = discord.Embed(
+                    title="🗂️ All Stored Runs",
+                    description=f"Showing last {len(recent_runs)} run(s)",
+                    color=0x3498db
+                )
                 
-                runs_text += f"**#{seq_id}** {completed} +{level} {dungeon}\n"
-                runs_text += f"   {char_name}-{char_realm} ({char_region}) - {date_str}\n\n"
-            
-            embed.description = f"Showing last {len(recent_runs)} run(s)\nUse `!rio_details <#number>` for details"
-            embed.add_field(
-                name="📋 Runs List",
-                value=runs_text.strip() or "No runs available",
-                inline=False
-            )
-            
-            # Add stats
-            stats = await run_manager.get_stats()
-            embed.set_footer(text=f"Total runs in database: {stats['total_runs']}")
-            
-            await ctx.send(embed=embed)
-            
-        except Exception as e:
-            logger.error(f"List runs command error: {e}")
-            await ctx.send("❌ **Error**: Failed to list runs")
-        finally:
-            self._executing_commands.discard(command_key)
+                run_entries = []
+                for run_entry in recent_runs:
+                    seq_id = run_entry["sequential_id"]
+                    run_data = run_entry["data"]
+                    character_info = run_entry.get("character", {})
+                    
+                    # Extract run information
+                    dungeon = run_data.get("dungeon", "Unknown")
+                    level = run_data.get("mythic_level", 0)
+                    # Check if run was completed (even if depleted) vs abandoned
+                    # Runs with score > 0 or clear_time_ms > 0 were completed
+                    if run_data.get("score", 0) > 0 or run_data.get("clear_time_ms", 0) > 0:
+                        completed = "✅" if run_data.get("num_chests", 0) >= 1 else "⏱️"  # Timed vs Depleted
+                    else:
+                        completed = "❌"  # Abandoned/Failed
+                    
+                    # Character information
+                    char_name = character_info.get("name", "Unknown")
+                    char_realm = character_info.get("realm", "Unknown")
+                    char_region = character_info.get("region", "us").upper()
+                    
+                    # Date information
+                    completed_at = run_data.get("completed_at", "")
+                    if completed_at:
+                        date_str = completed_at.partition('T')[0]
+                    else:
+                        date_str = "Unknown"
+                    
+                    run_entries.append(
+                        f"**#{seq_id}** {completed} +{level} {dungeon}\n"
+                        f"   {char_name}-{char_realm} ({char_region}) - {date_str}"
+                    )
+                
+                embed.description = f"Showing last {len(recent_runs)} run(s)\nUse `!rio_details <#number>` for details"
+                embed.add_field(
+                    name="📋 Runs List",
+                    value="\n\n".join(run_entries) or "No runs available",
+                    inline=False
+                )
+                
+                # Add stats
+                stats = await run_manager.get_stats()
+                embed.set_footer(text=f"Total runs in database: {stats['total_runs']}")
+                
+                await ctx.send(embed=embed)
+                
+            except Exception as e:
+                logger.exception("List runs command error: %s", e)
+                await ctx.send("❌ **Error**: Failed to list runs")
     
     @commands.command(name='rio_cutoff')
     async def raiderio_cutoffs(self, ctx, *, args: str = None):
@@ -337,33 +266,16 @@ class RaiderIOCommands(commands.Cog):
         !rio_cutoff 2                # Uses your character #2's region
         !rio_cutoff eu season-tww-3  # Specific region and season
         """
-        command_key = f"rio_cutoff_{ctx.author.id}"
-        if command_key in self._executing_commands:
-            return
-        
-        self._executing_commands.add(command_key)
-        
-        try:
-            # Parse region and season from arguments
+        async def prepare():
             region, season = await self._parse_region_and_season_from_args(ctx, args)
             if region is None:
-                return  # Error already sent
-            
-            loading_msg = await ctx.send(f"🔍 Fetching Mythic+ cutoffs for {region.upper()}...")
-            
-            # Handle cutoffs lookup
-            success, result = await CommandHandlers.handle_cutoffs_lookup(region, season)
-            
-            if success:
-                await loading_msg.edit(content=None, embed=result)
-            else:
-                await loading_msg.edit(content=result)
-                
-        except Exception as e:
-            logger.error(f"RaiderIO cutoffs command error: {e}")
-            await ctx.send(f"❌ **Error**: Failed to fetch cutoffs data")
-        finally:
-            self._executing_commands.discard(command_key)
+                return None
+            return (
+                f"🔍 Fetching Mythic+ cutoffs for {region.upper()}...",
+                lambda: CommandHandlers.handle_cutoffs_lookup(region, season)
+            )
+        
+        await self._run_lookup(ctx, "rio_cutoff", "Failed to fetch cutoffs data", prepare)
     
     @commands.command(name='rio_prefetch')
     async def prefetch_all_runs(self, ctx):
@@ -378,63 +290,59 @@ class RaiderIOCommands(commands.Cog):
             await ctx.send("❌ This command is admin-only")
             return
         
-        command_key = f"rio_prefetch_{ctx.author.id}"
-        if command_key in self._executing_commands:
-            return
-        
-        self._executing_commands.add(command_key)
-        
-        try:
-            from ..wow.startup_loader import startup_loader
-            
-            loading_msg = await ctx.send("🔄 Pre-fetching runs for all stored characters...")
-            
-            # Reset loader state
-            startup_loader.loaded_characters = 0
-            startup_loader.loaded_runs = 0
-            startup_loader.failed_characters = []
-            
-            # Run the pre-fetch
-            stats = await startup_loader.load_all_character_runs(enabled=True)
+        async with self._guard.exclusive(("rio_prefetch", ctx.author.id)) as acquired:
+            if not acquired:
+                return
             
-            if stats.get("status") == "no_characters":
-                await loading_msg.edit(content="❌ No characters stored to pre-fetch")
-            elif stats.get("status") == "completed":
-                embed = discord.Embed(
-                    title="✅ Pre-fetch Complete",
-                    color=0x2ecc71
-                )
-                embed.add_field(
-                    name="📊 Statistics",
-                    value=(
-                        f"**Characters processed**: {stats['characters_processed']}\n"
-                        f"**Characters failed**: {stats['characters_failed']}\n"
-                        f"**Runs loaded**: {stats['runs_loaded']}\n"
-                        f"**Total runs in DB**: {stats['total_runs_in_db']}\n"
-                        f"**Time elapsed**: {stats['time_elapsed']}"
-                    ),
-                    inline=False
-                )
+            try:
+                from ..wow.startup_loader import startup_loader
+                
+                loading_msg = await ctx.send("🔄 Pre-fetching runs for all stored characters...")
                 
-                if startup_loader.failed_characters:
-                    failed_list = "\n".join(startup_loader.failed_characters[:10])
-                    if len(startup_loader.failed_characters) > 10:
-                        failed_list += f"\n... and {len(startup_loader.failed_characters) - 10} more"
+                # Reset loader state
+                startup_loader.loaded_characters = 0
+                startup_loader.loaded_runs = 0
+                startup_loader.failed_characters = []
+                
+                # Run the pre-fetch
+                stats = await startup_loader.load_all_character_runs(enabled=True)
+                
+                if stats.get("status") == "no_characters":
+                    await loading_msg.edit(content="❌ No characters stored to pre-fetch")
+                elif stats.get("status") == "completed":
+                    embed = discord.Embed(
+                        title="✅ Pre-fetch Complete",
+                        color=0x2ecc71
+                    )
                     embed.add_field(
-                        name="❌ Failed Characters",
-                        value=failed_list,
+                        name="📊 Statistics",
+                        value=(
+                            f"**Characters processed**: {stats['characters_processed']}\n"
+                            f"**Characters failed**: {stats['characters_failed']}\n"
+                            f"**Runs loaded**: {stats['runs_loaded']}\n"
+                            f"**Total runs in DB**: {stats['total_runs_in_db']}\n"
+                            f"**Time elapsed**: {stats['time_elapsed']}"
+                        ),
                         inline=False
                     )
-                
-                await loading_msg.edit(content=None, embed=embed)
-            else:
-                await loading_msg.edit(content="❌ Pre-fetch failed or was disabled")
-                
-        except Exception as e:
-            logger.error(f"Pre-fetch command error: {e}")
-            await ctx.send(f"❌ **Error**: Failed to pre-fetch runs")
-        finally:
-            self._executing_commands.discard(command_key)
+                    
+                    if startup_loader.failed_characters:
+                        failed_list = "\n".join(startup_loader.failed_characters[:10])
+                        if len(startup_loader.failed_characters) > 10:
+                            failed_list += f"\n... and {len(startup_loader.failed_characters) - 10} more"
+                        embed.add_field(
+                            name="❌ Failed Characters",
+                            value=failed_list,
+                            inline=False
+                        )
+                    
+                    await loading_msg.edit(content=None, embed=embed)
+                else:
+                    await loading_msg.edit(content="❌ Pre-fetch failed or was disabled")
+                    
+            except Exception as e:
+                logger.exception("Pre-fetch command error: %s", e)
+                await ctx.send(f"❌ **Error**: Failed to pre-fetch runs")
     
     @commands.command(name='rio_season')
     async def raiderio_season(self, ctx, *, season: str = None):
@@ -448,63 +356,59 @@ class RaiderIOCommands(commands.Cog):
         !rio_season season-tww-2        # Set to previous season
         !rio_season reset               # Reset to 'current'
         """
-        command_key = f"rio_season_{ctx.author.id}"
-        if command_key in self._executing_commands:
-            return
-        
-        self._executing_commands.add(command_key)
-        
-        try:
-            # If no season provided, show current season
-            if not season:
-                current_season = await season_manager.get_current_season()
-                stats = await season_manager.get_stats()
-                
-                embed = discord.Embed(
-                    title="⚙️ RaiderIO Season Settings",
-                    color=0x3498db
-                )
-                
-                embed.add_field(
-                    name="📅 Current Season",
-                    value=f"**{current_season}**",
-                    inline=True
-                )
-                
-                if stats["known_seasons"] > 0:
-                    seasons_list = ", ".join(stats["seasons_list"][-5:])  # Show last 5
+        async with self._guard.exclusive(("rio_season", ctx.author.id)) as acquired:
+            if not acquired:
+                return
+            
+            try:
+                # If no season provided, show current season
+                if not season:
+                    current_season = await season_manager.get_current_season()
+                    stats = await season_manager.get_stats()
+                    
+                    embed = discord.Embed(
+                        title="⚙️ RaiderIO Season Settings",
+                        color=0x3498db
+                    )
+                    
                     embed.add_field(
-                        name="🗄️ Known Seasons",
-                        value=seasons_list,
+                        name="📅 Current Season",
+                        value=f"**{current_season}**",
                         inline=True
                     )
+                    
+                    if stats["known_seasons"] > 0:
+                        seasons_list = ", ".join(stats["seasons_list"][-5:])  # Show last 5
+                        embed.add_field(
+                            name="🗄️ Known Seasons",
+                            value=seasons_list,
+                            inline=True
+                        )
+                    
+                    embed.add_field(
+                        name="💡 Usage",
+                        value="`!rio_season season-tww-3` - Set season\n"
+                              "`!rio_season current` - Use current season\n"
+                              "`!rio_season reset` - Reset to current",
+                        inline=False
+                    )
+                    
+                    embed.set_footer(text="Season setting affects !rio_details and !rio_cutoff commands")
+                    await ctx.send(embed=embed)
+                    return
                 
-                embed.add_field(
-                    name="💡 Usage",
-                    value="`!rio_season season-tww-3` - Set season\n"
-                          "`!rio_season current` - Use current season\n"
-                          "`!rio_season reset` - Reset to current",
-                    inline=False
-                )
+                # Handle special cases
+                season = season.strip()
+                if season.lower() == "reset":
+                    result = await season_manager.reset_to_current()
+                else:
+                    result = await season_manager.set_current_season(season)
                 
-                embed.set_footer(text="Season setting affects !rio_details and !rio_cutoff commands")
-                await ctx.send(embed=embed)
-                return
-            
-            # Handle special cases
-            season = season.strip()
-            if season.lower() == "reset":
-                result = await season_manager.reset_to_current()
-            else:
-                result = await season_manager.set_current_season(season)
-            
-            await ctx.send(result["message"])
-            
-        except Exception as e:
-            logger.error(f"RaiderIO season command error: {e}")
-            await ctx.send("❌ **Error**: Failed to manage season settings")
-        finally:
-            self._executing_commands.discard(command_key)
+                await ctx.send(result["message"])
+                
+            except Exception as e:
+                logger.exception("RaiderIO season command error: %s", e)
+                await ctx.send("❌ **Error**: Failed to manage season settings")
     
     @commands.command(name='rio_reset_runs')
     @commands.has_permissions(administrator=True)
@@ -553,8 +457,100 @@ class RaiderIOCommands(commands.Cog):
         except asyncio.TimeoutError:
             await ctx.send("❌ Reset cancelled - no response received within 30 seconds.")
     
+    @app_commands.command(name='rio_help', description="Show RaiderIO command help")
+    async def raiderio_help_slash(self, interaction: discord.Interaction):
+        """Slash command version of !rio help"""
+        await interaction.response.send_message(embed=self._help_embed)
+    
+    async def _run_lookup(self, ctx, command_name: str, error_text: str, prepare):
+        """
+        Run a RaiderIO lookup command with the shared duplicate guard, loading message and error handling
+        
+        prepare() returns (loading_text, lookup) or None if it already replied;
+        lookup() returns the handler's (success, embed or error_message) tuple.
+        """
+        async with self._guard.exclusive((command_name, ctx.author.id)) as acquired:
+            if not acquired:
+                return
+            
+            try:
+                prepared = await prepare()
+                if prepared is None:
+                    return  # Help or error message already sent
+                loading_text, lookup = prepared
+                
+                loading_msg = await ctx.send(loading_text)
+                success, result = await lookup()
+                
+                if success:
+                    await loading_msg.edit(content=None, embed=result)
+                else:
+                    await loading_msg.edit(content=result)
+                    
+            except Exception as e:
+                logger.exception("RaiderIO %s command error: %s", command_name, e)
+                await ctx.send(f"❌ **Error**: {error_text}")
+    
+    async def _parse_character(self, ctx, args: Optional[str]) -> Optional[Tuple[str, str, str]]:
+        """Resolve (character, realm, region) from command args, or None once help/an error was sent"""
+        character_data = await CommandHandlers.parse_character_args(ctx, args)
+        if character_data is None:
+            return None
+        
+        if character_data.get('show_help'):
+            await self._show_help(ctx)
+            return None
+        
+        # Stored characters skip the parser's region check, so validate before any loading message or API call
+        region = character_data['region']
+        if not CommandHandlers.validate_region(region):
+            await ctx.send(f"❌ **Invalid region**: `{region}`. Valid regions: {VALID_REGIONS_TEXT}")
+            return None
+        
+        return character_data['name'], character_data['realm'], region
+    
+    async def _parse_region_from_args(self, ctx, args: Optional[str]) -> Optional[str]:
+        """Resolve a region from `<region>`, `<character number>` or nothing (US), or None once an error was sent"""
+        parts = args.split(maxsplit=1) if args else []
+        if not parts:
+            return "us"
+        
+        if parts[0].isdecimal():
+            selected_char = await CommandHandlers.get_numbered_character(ctx, parts[0])
+            if selected_char is None:
+                return None
+            region = selected_char['region']
+        else:
+            region = parts[0].lower()
+        
+        if not CommandHandlers.validate_region(region):
+            await ctx.send(f"❌ **Invalid region**: `{region}`. Valid regions: {VALID_REGIONS_TEXT}")
+            return None
+        
+        return region
+    
+    async def _parse_region_and_season_from_args(self, ctx, args: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+        """Resolve (region, season) from `[region | character number] [season]`, or (None, None) once an error was sent"""
+        parts = args.split(maxsplit=2) if args else []
+        
+        region = await self._parse_region_from_args(ctx, parts[0] if parts else None)
+        if region is None:
+            return None, None
+        
+        # Fall back to the !rio_season setting; 'current' lets the API pick the live season
+        season = parts[1] if len(parts) > 1 else await season_manager.get_current_season()
+        if season == "current":
+            season = None
+        
+        return region, season
+    
     async def _show_help(self, ctx):
         """Show RaiderIO command help"""
+        await ctx.send(embed=self._help_embed)
+    
+    @staticmethod
+    def _build_help_embed() -> discord.Embed:
+        """Build the static RaiderIO help embed"""
         embed = discord.Embed(
             title="🏆 RaiderIO Commands",
             description="World of Warcraft character and Mythic+ lookup",
@@ -645,7 +641,7 @@ class RaiderIOCommands(commands.Cog):
         
         embed.set_footer(text="Data provided by RaiderIO API")
         
-        await ctx.send(embed=embed)
+        return embed
     
     # All formatting methods moved to separate modules
 
@@ -655,7 +651,5 @@ async def setup(bot):
         await bot.add_cog(RaiderIOCommands(bot))
         logger.info("RaiderIO cog setup completed successfully")
     except Exception as e:
-        logger.error(f"Failed to setup RaiderIO cog: {e}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Failed to setup RaiderIO cog: %s", e)
         raise
\ No newline at end of file
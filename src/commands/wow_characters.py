@@ -9,6 +9,7 @@ from typing import Optional
 import json
 from pathlib import Path
 from ..wow.character_manager import character_manager
+from ..wow.command_handlers import VALID_REGIONS, VALID_REGIONS_TEXT
 from ..config import config
 from ..utils.logging import get_logger
 
@@ -43,7 +44,7 @@ class WoWCharacterCommands(commands.Cog):
                 await ctx.send("❌ **Usage**: `!add_char <character> <realm> [region]`\nExample: `!add_char Thrall Mal'Ganis`")
                 return
             
-            parts = args.strip().split()
+            parts = args.strip().split(maxsplit=3)
             
             if len(parts) < 2:
                 await ctx.send("❌ **Usage**: `!add_char <character> <realm> [region]`")
@@ -54,9 +55,8 @@ class WoWCharacterCommands(commands.Cog):
             region = parts[2].lower() if len(parts) > 2 else "us"
             
             # Validate region
-            valid_regions = ["us", "eu", "kr", "tw", "cn"]
-            if region not in valid_regions:
-                await ctx.send(f"❌ **Invalid region**: `{region}`. Valid regions: {', '.join(valid_regions)}")
+            if region not in VALID_REGIONS:
+                await ctx.send(f"❌ **Invalid region**: `{region}`. Valid regions: {VALID_REGIONS_TEXT}")
                 return
             
             # Add character
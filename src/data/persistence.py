@@ -7,6 +7,9 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Seconds to coalesce mark_dirty() calls into a single save per data set
+FLUSH_DELAY = 1.5
+
 class DataManager:
     """Handles persistent data storage and retrieval"""
     
@@ -16,6 +19,8 @@ class DataManager:
         self.permanent_context: Dict[str, list] = {}
         self.unfiltered_permanent_context: list = []
         self._lock = asyncio.Lock()
+        self._dirty: set = set()
+        self._flush_task: Optional[asyncio.Task] = None
     
     async def load_all_data(self):
         """Load all data from files asynchronously"""
@@ -116,6 +121,25 @@ class DataManager:
             except Exception as e:
                 logger.error(f"Error saving unfiltered permanent context: {e}")
     
+    def mark_dirty(self, name: str):
+        """Schedule a debounced save of a data set, e.g. 'user_settings' for save_user_settings"""
+        self._dirty.add(name)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_delay())
+    
+    async def _flush_after_delay(self):
+        """Wait out the debounce window, then write everything marked dirty"""
+        await asyncio.sleep(FLUSH_DELAY)
+        await self.flush_dirty()
+    
+    async def flush_dirty(self):
+        """Save every data set marked dirty since the last flush"""
+        # Marks made while a save awaits the lock don't schedule a new task, so keep going until none are left
+        while self._dirty:
+            dirty, self._dirty = self._dirty, set()
+            for name in dirty:
+                await getattr(self, f"save_{name}")()
+    
     def get_user_key(self, user) -> str:
         """Generate consistent user key for data storage"""
         return f"{user.name}#{user.discriminator}" if user.discriminator != "0" else user.name
@@ -19,6 +19,7 @@ class EventHandlers(commands.Cog):
         self.ai_handler = None
         self.search_handler = None
         self.crafting_handler = None
+        self._tree_synced = False
     
     def set_handlers(self, ai_handler: Any, search_handler: Any, crafting_handler: Any) -> None:
         """Set handler references after bot initialization"""
@@ -31,6 +32,15 @@ class EventHandlers(commands.Cog):
         """Called when the bot is ready"""
         logger.info(f'{self.bot.user} has connected to Discord!')
         
+        # Register slash commands once; on_ready fires again on every reconnect
+        if not self._tree_synced:
+            try:
+                synced = await self.bot.tree.sync()
+                self._tree_synced = True
+                logger.info(f"Synced {len(synced)} application command(s)")
+            except discord.HTTPException as e:
+                logger.error(f"Failed to sync application commands: {e}")
+        
         # Report character manager startup errors
         try:
             from ..wow.character_manager import character_manager
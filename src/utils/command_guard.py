@@ -0,0 +1,27 @@
+"""Per-key guard against overlapping runs of the same command"""
+import asyncio
+from contextlib import asynccontextmanager
+
+
+class CommandGuard:
+    """Lets one invocation per key run at a time, e.g. keyed on (command, author_id)"""
+    
+    def __init__(self):
+        self._locks = {}  # key -> lock held while that command runs
+    
+    @asynccontextmanager
+    async def exclusive(self, key):
+        """Hold the lock for a command key, yielding False if that command is already running"""
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        elif lock.locked():
+            yield False
+            return
+        try:
+            async with lock:
+                yield True
+        finally:
+            # Only commands in progress keep an entry
+            if not lock.locked() and self._locks.get(key) is lock:
+                del self._locks[key]
@@ -18,6 +18,10 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Regions the RaiderIO API serves
+VALID_REGIONS = frozenset({"us", "eu", "kr", "tw", "cn"})
+VALID_REGIONS_TEXT = "us, eu, kr, tw, cn"
+
 
 class CommandHandlers:
     """Handles the core logic for RaiderIO commands"""
@@ -119,15 +123,15 @@ class CommandHandlers:
         if not errors:
             return
         
-        error_msg = f"⚠️ **Warning**: Failed to extract RaiderIO IDs for {len(errors)} {run_type} run(s):\n"
+        lines = [f"⚠️ **Warning**: Failed to extract RaiderIO IDs for {len(errors)} {run_type} run(s):"]
         for error in errors[:3]:  # Show first 3 errors
-            error_msg += f"• {error['dungeon']} +{error['level']}: {error['reason']}\n"
+            lines.append(f"• {error['dungeon']} +{error['level']}: {error['reason']}")
         
         if len(errors) > 3:
-            error_msg += f"... and {len(errors) - 3} more\n"
+            lines.append(f"... and {len(errors) - 3} more")
         
-        error_msg += "\nThese runs have been numbered but `!rio_details` may show limited information."
-        await ctx.send(error_msg)
+        lines.append("\nThese runs have been numbered but `!rio_details` may show limited information.")
+        await ctx.send("\n".join(lines))
     
     @staticmethod
     async def handle_affixes_lookup(region: str) -> Tuple[bool, Any]:
@@ -315,21 +319,15 @@ class CommandHandlers:
                 return None
             return main_char
         
-        parts = args.strip().split()
+        parts = args.strip().split(maxsplit=3)
         
         # Check for help
         if len(parts) == 1 and parts[0].lower() == 'help':
             return {'show_help': True}
         
         # Check if it's a number (character selection)
-        if len(parts) == 1 and parts[0].isdigit():
-            char_index = int(parts[0]) - 1  # Convert to 0-based
-            selected_char = await character_manager.get_character(ctx.author.id, char_index)
-            if not selected_char:
-                chars = await character_manager.get_all_characters(ctx.author.id)
-                await ctx.send(f"❌ Invalid character number. You have {len(chars)} character(s)")
-                return None
-            return selected_char
+        if len(parts) == 1 and parts[0].isdecimal():
+            return await CommandHandlers.get_numbered_character(ctx, parts[0])
         
         # Manual character specification
         if len(parts) < 2:
@@ -341,9 +339,8 @@ class CommandHandlers:
         region = parts[2].lower() if len(parts) > 2 else "us"
         
         # Validate region
-        valid_regions = ["us", "eu", "kr", "tw", "cn"]
-        if region not in valid_regions:
-            await ctx.send(f"❌ **Invalid region**: `{region}`. Valid regions: {', '.join(valid_regions)}")
+        if region not in VALID_REGIONS:
+            await ctx.send(f"❌ **Invalid region**: `{region}`. Valid regions: {VALID_REGIONS_TEXT}")
             return None
         
         return {
@@ -352,8 +349,17 @@ class CommandHandlers:
             'region': region
         }
     
+    @staticmethod
+    async def get_numbered_character(ctx: commands.Context, number: str) -> Optional[Dict[str, Any]]:
+        """Get the author's stored character by its 1-based number, or None after sending an error"""
+        selected_char = await character_manager.get_character(ctx.author.id, int(number) - 1)
+        if not selected_char:
+            chars = await character_manager.get_all_characters(ctx.author.id)
+            await ctx.send(f"❌ Invalid character number. You have {len(chars)} character(s)")
+            return None
+        return selected_char
+    
     @staticmethod
     def validate_region(region: str) -> bool:
         """Validate that the region is supported"""
-        valid_regions = ["us", "eu", "kr", "tw", "cn"]
-        return region.lower() in valid_regions
\ No newline at end of file
+        return region.lower() in VALID_REGIONS
\ No newline at end of file
@@ -10,6 +10,8 @@ from .formatters import RaiderIOFormatters
 
 logger = get_logger(__name__)
 
+_RUNS_COLOR = discord.Colour(0x9b59b6)
+
 
 class RunEmbedFactory:
     """Factory for creating run detail embeds"""
@@ -31,7 +33,7 @@ class RunEmbedFactory:
         embed = discord.Embed(
             title=f"🏃 Mythic+ Runs - {name}",
             description=f"{realm} ({region})",
-            color=0x9b59b6
+            color=_RUNS_COLOR
         )
         
         # Recent runs
@@ -90,7 +92,7 @@ class RunEmbedFactory:
             if not is_best:
                 completed_at = run.get("completed_at", "")
                 if completed_at:
-                    date_str = f" - {completed_at.split('T')[0] if 'T' in completed_at else completed_at}"
+                    date_str = f" - {completed_at.partition('T')[0]}"
             
             if is_best:
                 formatted_runs.append(f"**#{seq_id}** ⭐ **+{level} {dungeon}**{time_str} - {score:.0f}")
@@ -203,7 +205,7 @@ class RunEmbedFactory:
         """Add completion date"""
         completed_at = data.get("completed_at", "")
         if completed_at:
-            date_str = completed_at.split('T')[0] if 'T' in completed_at else completed_at
+            date_str = completed_at.partition('T')[0]
             embed.add_field(
                 name="📅 Completed",
                 value=RaiderIOFormatters.safe_field_value(date_str) or "Unknown",
@@ -217,17 +219,17 @@ class RunEmbedFactory:
         if not roster:
             return
         
-        team_text = ""
+        team_lines = []
         for player in roster:
             character = player.get("character", {})
             name = character.get("name", "Unknown")
             spec = character.get("spec", {}).get("name", "Unknown")
             char_class = character.get("class", {}).get("name", "Unknown")
-            team_text += f"**{name}** - {spec} {char_class}\n"
+            team_lines.append(f"**{name}** - {spec} {char_class}")
         
         embed.add_field(
             name="👥 Team Composition",
-            value=RaiderIOFormatters.safe_field_value(team_text.strip()) or "No team data",
+            value=RaiderIOFormatters.safe_field_value("\n".join(team_lines)) or "No team data",
             inline=False
         )
     
@@ -238,14 +240,14 @@ class RunEmbedFactory:
         if not affixes:
             return
         
-        affix_text = ""
+        affix_lines = []
         for affix in affixes:
             name = affix.get("name", "Unknown")
-            affix_text += f"• {name}\n"
+            affix_lines.append(f"• {name}")
         
         embed.add_field(
             name="⚡ Affixes",
-            value=RaiderIOFormatters.safe_field_value(affix_text.strip()) or "No affix data",
+            value=RaiderIOFormatters.safe_field_value("\n".join(affix_lines)) or "No affix data",
             inline=False
         )
     
@@ -285,7 +287,7 @@ class RunEmbedFactory:
         # Date if available
         completed_at = data.get("completed_at", "")
         if completed_at:
-            date_str = completed_at.split('T')[0] if 'T' in completed_at else completed_at
+            date_str = completed_at.partition('T')[0]
             embed.add_field(
                 name="📅 Completed",
                 value=date_str,
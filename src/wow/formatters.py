@@ -4,34 +4,44 @@ Handles formatting of RaiderIO data into Discord embeds and messages
 """
 
 import discord
+from collections import deque
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Discord embed colors, built once so embeds skip the int -> Colour conversion
+CLASS_COLORS = MappingProxyType({
+    "Death Knight": discord.Colour(0xC41F3B),
+    "Demon Hunter": discord.Colour(0xA330C9),
+    "Druid": discord.Colour(0xFF7D0A),
+    "Evoker": discord.Colour(0x33937F),
+    "Hunter": discord.Colour(0xABD473),
+    "Mage": discord.Colour(0x69CCF0),
+    "Monk": discord.Colour(0x00FF96),
+    "Paladin": discord.Colour(0xF58CBA),
+    "Priest": discord.Colour(0xFFFFFF),
+    "Rogue": discord.Colour(0xFFF569),
+    "Shaman": discord.Colour(0x0070DE),
+    "Warlock": discord.Colour(0x9482C9),
+    "Warrior": discord.Colour(0xC79C6E)
+})
+DEFAULT_CLASS_COLOR = discord.Colour(0x5865F2)
+_AFFIXES_COLOR = discord.Colour(0xe74c3c)
+
+# Discord embed limits
+_EMBED_FIELD_LIMIT = 25
+_EMBED_TOTAL_LIMIT = 6000
+
 
 class RaiderIOFormatters:
     """Handles formatting of RaiderIO data for Discord"""
     
     @staticmethod
-    def get_class_color(char_class: str) -> int:
+    def get_class_color(char_class: str) -> discord.Colour:
         """Get Discord embed color for WoW class"""
-        colors = {
-            "Death Knight": 0xC41F3B,
-            "Demon Hunter": 0xA330C9,
-            "Druid": 0xFF7D0A,
-            "Evoker": 0x33937F,
-            "Hunter": 0xABD473,
-            "Mage": 0x69CCF0,
-            "Monk": 0x00FF96,
-            "Paladin": 0xF58CBA,
-            "Priest": 0xFFFFFF,
-            "Rogue": 0xFFF569,
-            "Shaman": 0x0070DE,
-            "Warlock": 0x9482C9,
-            "Warrior": 0xC79C6E
-        }
-        return colors.get(char_class, 0x5865F2)
+        return CLASS_COLORS.get(char_class, DEFAULT_CLASS_COLOR)
     
     @staticmethod
     def format_time_duration(time_ms: int) -> str:
@@ -39,9 +49,8 @@ class RaiderIOFormatters:
         if time_ms <= 0:
             return "Unknown"
         
-        minutes = time_ms // 60000
-        seconds = (time_ms % 60000) // 1000
-        return f"{minutes}:{seconds:02d}"
+        minutes, remainder_ms = divmod(time_ms, 60000)
+        return f"{minutes}:{remainder_ms // 1000:02d}"
     
     @staticmethod
     def get_completion_status(run_data: Dict[str, Any]) -> str:
@@ -81,6 +90,7 @@ class RaiderIOFormatters:
         
         embed = discord.Embed(
             title=f"🏆 {name} - {realm} ({region})",
+            url=data.get("profile_url") or None,
             color=RaiderIOFormatters.get_class_color(data.get("class", "Unknown"))
         )
         
@@ -96,14 +106,20 @@ class RaiderIOFormatters:
             inline=True
         )
         
+        # Optional sections; each is skipped when the profile omits it
+        mp_scores = data.get("mythic_plus_scores_by_season")
+        recent_runs = data.get("mythic_plus_recent_runs")
+        raid_prog = data.get("raid_progression")
+        if not (mp_scores or recent_runs or raid_prog):
+            return embed
+        
         # Mythic+ scores
-        mp_scores = data.get("mythic_plus_scores_by_season", [])
         if mp_scores:
-            current_season = mp_scores[0]
-            all_score = current_season.get("scores", {}).get("all", 0)
-            dps_score = current_season.get("scores", {}).get("dps", 0)
-            healer_score = current_season.get("scores", {}).get("healer", 0)
-            tank_score = current_season.get("scores", {}).get("tank", 0)
+            scores = mp_scores[0].get("scores", {})
+            all_score = scores.get("all", 0)
+            dps_score = scores.get("dps", 0)
+            healer_score = scores.get("healer", 0)
+            tank_score = scores.get("tank", 0)
             
             embed.add_field(
                 name="⚡ Mythic+ Score",
@@ -115,50 +131,45 @@ class RaiderIOFormatters:
             )
         
         # Recent high run
-        recent_runs = data.get("mythic_plus_recent_runs", [])
         if recent_runs:
-            highest = max(recent_runs, key=lambda x: x.get("mythic_level", 0))
+            highest, highest_level = None, -1
+            for run in recent_runs:
+                run_level = run.get("mythic_level", 0)
+                if run_level > highest_level:
+                    highest, highest_level = run, run_level
             embed.add_field(
                 name="🏃 Recent High",
-                value=f"+{highest.get('mythic_level', 0)} {highest.get('dungeon', 'Unknown')}",
+                value=f"+{highest_level} {highest.get('dungeon', 'Unknown')}",
                 inline=True
             )
         
         # Raid progression
-        RaiderIOFormatters._add_raid_progression(embed, data)
-        
-        # Profile URL
-        profile_url = data.get("profile_url", "")
-        if profile_url:
-            embed.url = profile_url
+        if raid_prog:
+            RaiderIOFormatters._add_raid_progression(embed, raid_prog)
         
         return embed
     
     @staticmethod
-    def _add_raid_progression(embed: discord.Embed, data: Dict[str, Any]):
+    def _add_raid_progression(embed: discord.Embed, raid_prog: Dict[str, Any]):
         """Add raid progression to character embed"""
-        raid_prog = data.get("raid_progression", {})
-        if not raid_prog:
-            return
-        
-        raid_text = ""
-        for raid_name, prog in list(raid_prog.items())[-2:]:  # Show last 2 raids
+        raid_lines = []
+        for raid_name, prog in deque(raid_prog.items(), maxlen=2):  # Show last 2 raids
             normal = prog.get("normal_bosses_killed", 0)
             heroic = prog.get("heroic_bosses_killed", 0)
             mythic = prog.get("mythic_bosses_killed", 0)
             total = prog.get("total_bosses", 0)
             
             if mythic > 0:
-                raid_text += f"**{raid_name}**: {mythic}/{total}M\n"
+                raid_lines.append(f"**{raid_name}**: {mythic}/{total}M")
             elif heroic > 0:
-                raid_text += f"**{raid_name}**: {heroic}/{total}H\n"
+                raid_lines.append(f"**{raid_name}**: {heroic}/{total}H")
             elif normal > 0:
-                raid_text += f"**{raid_name}**: {normal}/{total}N\n"
+                raid_lines.append(f"**{raid_name}**: {normal}/{total}N")
         
-        if raid_text:
+        if raid_lines:
             embed.add_field(
                 name="🏰 Raid Progress",
-                value=raid_text.strip(),
+                value="\n".join(raid_lines),
                 inline=False
             )
     
@@ -167,7 +178,7 @@ class RaiderIOFormatters:
         """Create embed for current affixes"""
         embed = discord.Embed(
             title=f"⚡ Weekly Mythic+ Affixes ({region.upper()})",
-            color=0xe74c3c
+            color=_AFFIXES_COLOR
         )
         
         if "error" in data:
@@ -176,13 +187,19 @@ class RaiderIOFormatters:
         
         affixes = data.get("affix_details", [])
         if affixes:
-            for affix in affixes:
-                name = affix.get("name", "Unknown")
+            total = len(embed)
+            for affix in affixes[:_EMBED_FIELD_LIMIT]:
+                name = f"🔥 {affix.get('name', 'Unknown')}"
                 description = affix.get("description", "No description available")
+                if len(description) > 200:
+                    description = description[:200] + "..."
                 
+                total += len(name) + len(description)
+                if total > _EMBED_TOTAL_LIMIT:
+                    break
                 embed.add_field(
-                    name=f"🔥 {name}",
-                    value=RaiderIOFormatters.safe_field_value(description[:200] + ("..." if len(description) > 200 else "")),
+                    name=name,
+                    value=description,
                     inline=False
                 )
         else:
@@ -222,17 +239,17 @@ class RaiderIOFormatters:
         # Display overall cutoffs if available
         if "all" in cutoffs:
             all_cutoffs = cutoffs["all"]
-            cutoff_text = ""
+            cutoff_lines = []
             
             for percentile, label in percentile_labels.items():
                 if percentile in all_cutoffs:
                     rating = all_cutoffs[percentile]
-                    cutoff_text += f"**{label}**: {rating:,}\n"
+                    cutoff_lines.append(f"**{label}**: {rating:,}")
             
-            if cutoff_text:
+            if cutoff_lines:
                 embed.add_field(
                     name="🏆 Overall Ratings",
-                    value=cutoff_text.strip(),
+                    value="\n".join(cutoff_lines),
                     inline=True
                 )
         
@@ -258,18 +275,18 @@ class RaiderIOFormatters:
         for role, icon in role_icons.items():
             if role in cutoffs:
                 role_cutoffs = cutoffs[role]
-                role_text = ""
+                role_lines = []
                 
                 # Show top percentiles for each role
                 for percentile in ["p99", "p95", "p90", "p75", "p50"]:
                     if percentile in role_cutoffs:
                         rating = role_cutoffs[percentile]
                         percentage = percentile.replace("p", "").replace("999", "99.9")
-                        role_text += f"**{percentage}th**: {rating:,}\n"
+                        role_lines.append(f"**{percentage}th**: {rating:,}")
                 
-                if role_text:
+                if role_lines:
                     embed.add_field(
                         name=f"{icon} {role_names[role]}",
-                        value=role_text.strip(),
+                        value="\n".join(role_lines),
                         inline=True
                     )
\ No newline at end of file
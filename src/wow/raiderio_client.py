@@ -5,12 +5,43 @@ Provides access to World of Warcraft Mythic+ scores, runs, and character data
 
 import aiohttp
 import asyncio
+import re
+import time
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any
 from urllib.parse import quote
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# Seconds a successful response is reused, per endpoint; affixes and cutoffs change rarely, finished runs never
+CACHE_TTLS = {
+    "characters/profile": 300,
+    "characters/mythic-plus-runs": 300,
+    "guilds/profile": 300,
+    "mythic-plus/affixes": 3600,
+    "mythic-plus/season-cutoffs": 3600,
+    "mythic-plus/run-details": 86400,
+}
+CACHE_MAX_ENTRIES = 512
+
+# Trailing numeric path segment of a run URL
+_RUN_URL_ID_RE = re.compile(r'(?:^|/)(\d+)$')
+
+# Client-side throttling to stay under RaiderIO's rate limit
+MAX_CONCURRENT_REQUESTS = 5
+REQUESTS_PER_SECOND = 5
+MAX_RETRY_AFTER = 30
+MAX_ATTEMPTS = 3
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
 
 class RaiderIOClient:
     """Client for interacting with the RaiderIO API"""
@@ -19,11 +50,20 @@ class RaiderIOClient:
     
     def __init__(self):
         self.session = None
+        # (endpoint, params) -> (fetched_at, data), oldest first; cached data is shared, so callers must not mutate it
+        self._cache: OrderedDict = OrderedDict()
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        # (region, realm, name, access_key) -> (fields, cache_key) of the character's latest profile fetch
+        self._profile_fields: Dict[tuple, tuple] = {}
+        self._request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._next_slot = 0.0
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create an aiohttp session"""
+        """Get or create the shared aiohttp session"""
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            # Pooled keep-alive connections so repeat lookups skip the TCP/TLS handshake
+            connector = aiohttp.TCPConnector(limit=20, limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=60)
+            self.session = aiohttp.ClientSession(connector=connector)
         return self.session
     
     async def close(self):
@@ -32,23 +72,98 @@ class RaiderIOClient:
             await self.session.close()
     
     async def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Make a request to the RaiderIO API"""
+        """Make a request to the RaiderIO API, serving recent successful responses from cache"""
+        ttl = CACHE_TTLS.get(endpoint)
+        cache_key = self._cache_key(endpoint, params)
+        if ttl:
+            cached = self._get_cached(cache_key, ttl)
+            if cached is not None:
+                return cached
+        
+        # Concurrent callers asking for the same thing share one HTTP request
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(endpoint, params, cache_key if ttl else None))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        # Shielded so one cancelled caller does not cancel the request for everyone else
+        return await asyncio.shield(task)
+    
+    async def _fetch(self, endpoint: str, params: Optional[Dict[str, Any]], cache_key: Optional[tuple]) -> Dict[str, Any]:
+        """Perform the HTTP request, caching a successful response under cache_key if given"""
         try:
             session = await self._get_session()
             url = f"{self.BASE_URL}/{endpoint}"
             
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    error_msg = self._get_error_message(response.status)
-                    logger.warning(f"RaiderIO API error {response.status}: {error_msg}")
-                    return {"error": error_msg}
+            async with self._request_slots:
+                for attempt in range(MAX_ATTEMPTS):
+                    await self._throttle()
+                    async with session.get(url, params=params) as response:
+                        status = response.status
+                        if status not in RETRYABLE_STATUSES or attempt == MAX_ATTEMPTS - 1:
+                            if status == 200:
+                                data = _json_loads(await response.read())
+                                if cache_key:
+                                    self._cache_response(cache_key, data)
+                                return data
+                            else:
+                                error_msg = self._get_error_message(status)
+                                logger.warning(f"RaiderIO API error {status}: {error_msg}")
+                                return {"error": error_msg}
+                        
+                        retry_after = self._get_retry_after(response) if status == 429 else None
+                    
+                    if retry_after is not None:
+                        # Rate limited: hold back every caller for as long as the API asks
+                        logger.warning(f"RaiderIO rate limited, retrying in {retry_after:.1f}s")
+                        self._next_slot = max(self._next_slot, time.monotonic() + retry_after)
+                    else:
+                        # Transient server error: exponential backoff for this request only
+                        delay = 2 ** attempt
+                        logger.warning(f"RaiderIO API error {status}, retrying in {delay}s")
+                        await asyncio.sleep(delay)
                     
         except Exception as e:
             logger.error(f"RaiderIO API request failed: {e}")
             return {"error": f"Request failed: {str(e)}"}
     
+    async def _throttle(self):
+        """Wait for the next request slot so requests are spaced REQUESTS_PER_SECOND apart"""
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + 1 / REQUESTS_PER_SECOND
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    @staticmethod
+    def _get_retry_after(response: aiohttp.ClientResponse) -> float:
+        """Seconds to wait from a 429 Retry-After header, defaulting to 1s"""
+        try:
+            delay = float(response.headers.get("Retry-After", 1))
+        except ValueError:
+            delay = 1.0
+        return min(max(delay, 0.0), MAX_RETRY_AFTER)
+    
+    @staticmethod
+    def _cache_key(endpoint: str, params: Optional[Dict[str, Any]]) -> tuple:
+        """Cache key for an endpoint and its query parameters"""
+        return (endpoint, tuple(sorted(params.items())) if params else ())
+    
+    def _get_cached(self, cache_key: tuple, ttl: float) -> Optional[Dict[str, Any]]:
+        """Return cached data younger than ttl seconds, marking it recently used"""
+        cached = self._cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            self._cache.move_to_end(cache_key)
+            return cached[1]
+        return None
+    
+    def _cache_response(self, cache_key: tuple, data: Dict[str, Any]):
+        """Store a response, evicting the least recently used entries past the size limit"""
+        self._cache[cache_key] = (time.monotonic(), data)
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+    
     def _get_error_message(self, status_code: int) -> str:
         """Get appropriate error message for HTTP status code"""
         error_messages = {
@@ -111,7 +226,27 @@ class RaiderIOClient:
         if access_key:
             params["access_key"] = access_key
         
-        return await self._make_request("characters/profile", params)
+        # A fresh profile fetched with more fields (e.g. !rio before !rio_runs) already holds what is asked for
+        profile_key = (params["region"], realm, name, access_key)
+        indexed = self._profile_fields.get(profile_key)
+        if indexed and indexed[0].issuperset(fields):
+            cached = self._get_cached(indexed[1], CACHE_TTLS["characters/profile"])
+            if cached is not None:
+                return cached
+        
+        data = await self._make_request("characters/profile", params)
+        if "error" not in data:
+            self._index_profile(profile_key, frozenset(fields), self._cache_key("characters/profile", params))
+        return data
+    
+    def _index_profile(self, profile_key: tuple, fields: frozenset, cache_key: tuple):
+        """Remember which cached profile response covers which fields for a character"""
+        self._profile_fields[profile_key] = (fields, cache_key)
+        if len(self._profile_fields) > CACHE_MAX_ENTRIES:
+            # Drop characters whose profile has been evicted from the response cache
+            self._profile_fields = {
+                key: entry for key, entry in self._profile_fields.items() if entry[1] in self._cache
+            }
     
     async def get_mythic_plus_runs(
         self, 
@@ -257,9 +392,9 @@ class RaiderIOClient:
         # Try extracting from URL
         if 'url' in run_data and run_data['url']:
             try:
-                url_parts = str(run_data['url']).split('/')
-                if url_parts and url_parts[-1].isdigit():
-                    return int(url_parts[-1])
+                match = _RUN_URL_ID_RE.search(str(run_data['url']))
+                if match:
+                    return int(match.group(1))
             except (ValueError, TypeError):
                 logger.warning(f"Failed to extract ID from URL: {run_data['url']}")
         
@@ -278,9 +413,8 @@ class RaiderIOClient:
         if time_ms <= 0:
             return "Unknown"
         
-        minutes = time_ms // 60000
-        seconds = (time_ms % 60000) // 1000
-        return f"{minutes}:{seconds:02d}"
+        minutes, remainder_ms = divmod(time_ms, 60000)
+        return f"{minutes}:{remainder_ms // 1000:02d}"
     
     def get_completion_status(self, run_data: Dict[str, Any]) -> str:
         """Get run completion status emoji"""
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test script for debounced data saves
+Verifies that a mark_dirty() made while a flush is saving still gets written
+"""
+
+import asyncio
+from src.data.persistence import DataManager
+
+async def check_mark_during_flush():
+    """Mark a second data set dirty while the first one's save is waiting on the lock"""
+    manager = DataManager()
+    saved = []
+    
+    async def save_user_settings():
+        async with manager._lock:
+            saved.append("user_settings")
+    
+    async def save_conversation_history():
+        async with manager._lock:
+            saved.append("conversation_history")
+    
+    manager.save_user_settings = save_user_settings
+    manager.save_conversation_history = save_conversation_history
+    
+    # Hold the lock so the flush blocks inside save_user_settings
+    await manager._lock.acquire()
+    manager.mark_dirty("user_settings")
+    flush = asyncio.create_task(manager.flush_dirty())
+    await asyncio.sleep(0)
+    
+    # Arrives mid-flush: the pending flush task isn't done, so no new task is scheduled
+    manager.mark_dirty("conversation_history")
+    manager._lock.release()
+    await flush
+    
+    if manager._flush_task is not None:
+        manager._flush_task.cancel()
+    
+    ok = saved == ["user_settings", "conversation_history"] and not manager._dirty
+    print(f"{'✅' if ok else '❌'} Saved during flush: {saved}, still dirty: {sorted(manager._dirty)}")
+    return ok
+
+def test_mark_during_flush():
+    assert asyncio.run(check_mark_during_flush())
+
+def main():
+    """Main test function"""
+    success = asyncio.run(check_mark_during_flush())
+    if not success:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()